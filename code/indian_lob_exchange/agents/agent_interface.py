@@ -19,6 +19,14 @@ class Agent(ABC):
         """
         pass
 
+    def on_market_batch(self, updates: list):
+        """
+        Callback for a batch of market data updates, delivered once per flush.
+        Defaults to calling on_market_update for each update in order.
+        """
+        for market_data in updates:
+            self.on_market_update(market_data)
+
     @abstractmethod
     def place_order(self):
         """
@@ -1,33 +1,59 @@
 """
 Defines the market data feed for broadcasting events to agents.
 """
-from typing import List
+from typing import Dict, List
 from .agent_interface import Agent
 
 class MarketDataFeed:
     """
     Broadcasts exchange events to all subscribed agents.
-    Implements a simple observer pattern.
+    Implements a simple observer pattern with batched delivery: events are
+    queued by broadcast() and handed to each agent once per flush().
     """
     def __init__(self):
         self._subscribers: List[Agent] = []
+        # Position of each subscriber in _subscribers, keyed by id(agent)
+        self._index: Dict[int, int] = {}
+        self._pending: List[dict] = []
 
     def subscribe(self, agent: Agent):
         """Add an agent to the subscription list."""
-        if agent not in self._subscribers:
+        key = id(agent)
+        if key not in self._index:
+            self._index[key] = len(self._subscribers)
             self._subscribers.append(agent)
-    
+
     def unsubscribe(self, agent: Agent):
-        """Remove an agent from the subscription list."""
-        self._subscribers.remove(agent)
+        """
+        Remove an agent from the subscription list.
+        The last subscriber is moved into the freed slot, so delivery order
+        is not preserved across unsubscribes.
+        """
+        i = self._index.pop(id(agent), None)
+        if i is None:
+            raise ValueError(f"Agent {agent.agent_id} is not subscribed.")
+        last = self._subscribers.pop()
+        if i < len(self._subscribers):
+            self._subscribers[i] = last
+            self._index[id(last)] = i
 
     def broadcast(self, market_data: dict):
         """
-        Send market data to all subscribed agents.
+        Queue market data for delivery to all subscribed agents.
         This would be called by the Exchange on events like trades or book updates.
         """
+        self._pending.append(market_data)
+
+    def flush(self):
+        """
+        Deliver all queued market data to each subscribed agent in a single call.
+        This should be called once at the end of each simulation step.
+        Errors raised by an agent propagate to the caller; the queue is
+        cleared before delivery so a failure never re-sends a batch.
+        """
+        if not self._pending:
+            return
+        batch = self._pending
+        self._pending = []
         for agent in self._subscribers:
-            try:
-                agent.on_market_update(market_data)
-            except Exception as e:
-                print(f"Error updating agent {agent.agent_id}: {e}")
+            agent.on_market_batch(batch)
@@ -1,37 +1,237 @@
 """
 Implements the order matching logic based on strict price-time priority.
 """
-from typing import List, Tuple
-from .order_book import OrderBook
-from .orders import Order, OrderSide, OrderType
-
-class Trade:
-    """Represents a single trade execution."""
-    def __init__(self, maker_order_id: int, taker_order_id: int, 
-                 price: float, quantity: int, timestamp: float):
-        self.maker_order_id = maker_order_id
-        self.taker_order_id = taker_order_id
-        self.price = price
-        self.quantity = quantity
-        self.timestamp = timestamp
-        
+from __future__ import annotations
+import operator
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from .order_book import Limit, OrderBook, PriceLadder
+from .orders import SIDE_BUY, TYPE_LIMIT, Order, tick_to_price
+
+class TradeLog:
+    """
+    A preallocated ring buffer of executed trades, stored column-wise.
+
+    Each trade is written straight into typed arrays at a monotonically
+    increasing row number, so matching allocates no per-trade objects.
+    Rows are read back through TradeView. Once `capacity` further trades
+    have been recorded a row is overwritten, so views are short-lived;
+    reading an overwritten row raises IndexError.
+    """
+    def __init__(self, capacity: int = 1 << 16):
+        """Initializes the log with room for at least `capacity` trades."""
+        capacity = 1 << max(capacity - 1, 0).bit_length() # Round up to a power of two
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._write = 0
+        self.maker_order_id = array('q', bytes(8 * capacity))
+        self.taker_order_id = array('q', bytes(8 * capacity))
+        self.price_tick = array('q', bytes(8 * capacity))
+        self.quantity = array('q', bytes(8 * capacity))
+        self.timestamp = array('d', bytes(8 * capacity))
+
+    @property
+    def write_index(self) -> int:
+        """The row number the next trade will be recorded at."""
+        return self._write
+
+    def record(self, maker_order_id: int, taker_order_id: int,
+               price_tick: int, quantity: int, timestamp: float) -> int:
+        """Writes a trade into the log and returns its row number."""
+        row = self._write
+        slot = row & self._mask
+        self.maker_order_id[slot] = maker_order_id
+        self.taker_order_id[slot] = taker_order_id
+        self.price_tick[slot] = price_tick
+        self.quantity[slot] = quantity
+        self.timestamp[slot] = timestamp
+        self._write = row + 1
+        return row
+
+    def _slot(self, row: int) -> int:
+        """Maps a row number to its slot, raising if the row has since been overwritten."""
+        if self._write - row > self.capacity:
+            raise IndexError(f"trade row {row} has been overwritten; the log holds "
+                             f"the last {self.capacity} trades")
+        return row & self._mask
+
+    @property
+    def last_price_tick(self) -> int:
+        """The price, in ticks, of the most recently recorded trade."""
+        return self.price_tick[self._slot(self._write - 1)]
+
+    def view(self, row: int) -> TradeView:
+        """Returns a view of the trade recorded at `row`."""
+        return TradeView(self, row)
+
+    def slice(self, start: int, end: int) -> TradeRange:
+        """Returns the trades recorded at rows [start, end)."""
+        return TradeRange(self, start, end)
+
+class TradeView:
+    """Represents a single trade execution, read on demand from a TradeLog."""
+    __slots__ = ('_log', 'row')
+
+    def __init__(self, log: TradeLog, row: int):
+        self._log = log
+        self.row = row
+
+    @property
+    def maker_order_id(self) -> int:
+        return self._log.maker_order_id[self._log._slot(self.row)]
+
+    @property
+    def taker_order_id(self) -> int:
+        return self._log.taker_order_id[self._log._slot(self.row)]
+
+    @property
+    def price_tick(self) -> int:
+        return self._log.price_tick[self._log._slot(self.row)]
+
+    @property
+    def price(self) -> float:
+        return tick_to_price(self.price_tick)
+
+    @property
+    def quantity(self) -> int:
+        return self._log.quantity[self._log._slot(self.row)]
+
+    @property
+    def timestamp(self) -> float:
+        return self._log.timestamp[self._log._slot(self.row)]
+
     def __repr__(self):
         return (f"Trade(Taker={self.taker_order_id}, Maker={self.maker_order_id}, "
                 f"Qty={self.quantity} @ {self.price})")
 
+class TradeRange:
+    """
+    The trades produced by a single order, as a [start, end) range of TradeLog rows.
+
+    Behaves as a read-only sequence of TradeView objects; slicing returns a
+    list of them. Reading a trade that the ring buffer has since overwritten
+    raises IndexError rather than returning another trade's data.
+    """
+    __slots__ = ('_log', 'start', 'end')
+
+    def __init__(self, log: TradeLog, start: int, end: int):
+        self._log = log
+        self.start = start
+        self.end = end
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TradeView, List[TradeView]]:
+        if isinstance(index, slice):
+            return [TradeView(self._log, self.start + i)
+                    for i in range(*index.indices(self.end - self.start))]
+        index = operator.index(index)
+        if index < 0:
+            index += self.end - self.start
+        if not 0 <= index < self.end - self.start:
+            raise IndexError("trade index out of range")
+        return TradeView(self._log, self.start + index)
+
+    def __iter__(self) -> Iterator[TradeView]:
+        log = self._log
+        for row in range(self.start, self.end):
+            yield TradeView(log, row)
+
+    def __repr__(self):
+        return f"TradeRange(start={self.start}, end={self.end})"
+
+def _match_kernel(level: Limit, orders: Dict[int, Order], taker_order_id: int,
+                  quantity: int, timestamp: float, trade_log: TradeLog,
+                  filled_makers: List[Order]) -> int:
+    """
+    Fills up to `quantity` against the resting orders at a single price level.
+
+    The loop works on locals and writes the level counters back once. Each fill
+    is recorded in `trade_log`. Fully filled makers are popped from the level
+    queue, removed from `orders` (the book's live order index) and appended to
+    `filled_makers`. Tombstones met at the head of the queue are dropped.
+
+    Returns:
+        The taker's remaining quantity.
+    """
+    price_tick = level.tick
+    queue = level.queue
+    record = trade_log.record
+    traded = 0
+    filled = 0
+    while queue and quantity > 0:
+        maker_order = orders.get(queue[0])
+        if maker_order is None: # Tombstone left by a cancellation
+            queue.popleft()
+            continue
+
+        maker_quantity = maker_order.quantity
+        if quantity < maker_quantity:
+            maker_order.quantity = maker_quantity - quantity
+            record(maker_order.order_id, taker_order_id, price_tick, quantity, timestamp)
+            traded += quantity
+            quantity = 0
+            break
+
+        record(maker_order.order_id, taker_order_id, price_tick, maker_quantity, timestamp)
+        traded += maker_quantity
+        quantity -= maker_quantity
+        maker_order.quantity = 0
+        maker_order.parent_limit = None
+        queue.popleft()
+        del orders[maker_order.order_id]
+        filled_makers.append(maker_order)
+        filled += 1
+
+    level.total_volume -= traded
+    level.order_count -= filled
+    return quantity
+
+def match_book(book_to_match: PriceLadder, orders: Dict[int, Order], taker_order_id: int,
+               is_buy: bool, limit_tick: Optional[int], quantity: int, timestamp: float,
+               trade_log: TradeLog, filled_makers: List[Order]) -> int:
+    """
+    Fills up to `quantity` against one side of the book, best level first.
+
+    Market orders (`limit_tick` None) match while the side has liquidity;
+    limit orders additionally stop once the best level is through their
+    price. Levels emptied along the way are discarded from the side. Shared
+    by MatchingEngine.match_order and the Exchange fast path.
+
+    Returns:
+        The taker's remaining quantity.
+    """
+    while quantity > 0:
+        best_price_limit = book_to_match.best_level
+        if best_price_limit is None:
+            break
+        if limit_tick is not None and ((is_buy and limit_tick < best_price_limit.tick) or
+                                       (not is_buy and limit_tick > best_price_limit.tick)):
+            break
+
+        # Fill against this price level in time priority
+        quantity = _match_kernel(best_price_limit, orders, taker_order_id, quantity,
+                                 timestamp, trade_log, filled_makers)
+
+        if best_price_limit.order_count == 0:
+            book_to_match.discard(best_price_limit)
+    return quantity
+
 class MatchingEngine:
     """
     Processes incoming orders and matches them against the order book.
     """
     def __init__(self, order_book: OrderBook):
         self.order_book = order_book
+        self.trade_log = TradeLog()
         self._trade_id_counter = 0
 
     def _generate_trade_id(self) -> int:
         self._trade_id_counter += 1
         return self._trade_id_counter
 
-    def match_order(self, incoming_order: Order) -> Tuple[List[Trade], List[Order]]:
+    def match_order(self, incoming_order: Order) -> Tuple[Tuple[int, int], List[Order]]:
         """
         Matches an incoming order against the book.
 
@@ -40,67 +240,28 @@ class MatchingEngine:
 
         Returns:
             A tuple containing:
-            - A list of trades that occurred.
+            - The (start, end) rows of the trades that occurred in the trade log.
             - A list of orders that were fully or partially filled (makers).
         """
-        trades = []
+        trade_log = self.trade_log
+        start = trade_log.write_index
         filled_maker_orders = []
-        
-        if incoming_order.side == OrderSide.BUY:
-            book_to_match = self.order_book.asks
-            is_matchable = lambda price: self.order_book.best_ask and price >= self.order_book.best_ask
-        else: # SELL
-            book_to_match = self.order_book.bids
-            is_matchable = lambda price: self.order_book.best_bid and price <= self.order_book.best_bid
-
-        # Handle Market and Limit orders that can be matched immediately
-        price_condition = (is_matchable(incoming_order.price) if incoming_order.order_type == OrderType.LIMIT 
-                           else bool(book_to_match))
-        
-        while incoming_order.quantity > 0 and price_condition:
-            best_price_limit = book_to_match.peekitem(0)[1]
-            
-            # Iterate through orders at this price level in time priority
-            current_order_node = best_price_limit.head_order
-            while current_order_node and incoming_order.quantity > 0:
-                trade_quantity = min(incoming_order.quantity, current_order_node.quantity)
-                
-                # *** BUG FIX STARTS HERE ***
-                # Explicitly reduce the total volume at the price level.
-                best_price_limit.total_volume -= trade_quantity
-                # *** BUG FIX ENDS HERE ***
-
-                trade = Trade(
-                    maker_order_id=current_order_node.order_id,
-                    taker_order_id=incoming_order.order_id,
-                    price=best_price_limit.price,
-                    quantity=trade_quantity,
-                    timestamp=incoming_order.timestamp
-                )
-                trades.append(trade)
-
-                incoming_order.quantity -= trade_quantity
-                current_order_node.quantity -= trade_quantity
-                
-                next_order_node = current_order_node.next_order
-                
-                if current_order_node.quantity == 0:
-                    filled_maker_orders.append(current_order_node)
-                    # Note: cancel_order also updates volume, but since the order's
-                    # quantity is now 0, its effect is neutral. Our manual reduction above
-                    # handles the actual traded volume.
-                    self.order_book.cancel_order(current_order_node.order_id)
-                
-                current_order_node = next_order_node
-
-            # Update price condition for the next loop iteration
-            price_condition = (is_matchable(incoming_order.price) if incoming_order.order_type == OrderType.LIMIT
-                               else bool(book_to_match))
+
+        is_buy = incoming_order.side_int == SIDE_BUY
+        book_to_match = self.order_book.asks if is_buy else self.order_book.bids
+        # The kernel unlinks filled makers from the book's order index directly
+        orders = self.order_book.live_orders
+        limit_tick = incoming_order.price_tick if incoming_order.type_int == TYPE_LIMIT else None
+
+        incoming_order.quantity = match_book(
+            book_to_match, orders, incoming_order.order_id, is_buy, limit_tick,
+            incoming_order.quantity, incoming_order.timestamp, trade_log, filled_maker_orders
+        )
 
         # If the incoming order has remaining quantity, it's a limit order that
         # rests on the book.
-        if incoming_order.quantity > 0 and incoming_order.order_type == OrderType.LIMIT:
+        if incoming_order.quantity > 0 and limit_tick is not None:
             self.order_book.add_order(incoming_order)
-            
-        return trades, filled_maker_orders
+
+        return (start, trade_log.write_index), filled_maker_orders
 
@@ -1,46 +1,42 @@
 """
 Implements the core Limit Order Book (LOB) data structure.
 
-The LOB is implemented using SortedDicts for buys (bids) and sells (asks),
-which provides logarithmic time complexity for adding new price levels.
-Each price level (Limit) contains a doubly-linked list of Orders,
-allowing for constant time complexity for cancellations.
+Prices are held as integer ticks, and each side of the book indexes its
+price levels (Limits) in a flat array covering the daily price band. Occupied
+levels are tracked in a hierarchical bitset, so finding the best bid or ask
+is a couple of bit operations rather than a tree walk.
+Each price level (Limit) holds a FIFO queue of order IDs; cancellations
+leave tombstones behind, allowing for constant time complexity.
 """
-from typing import Optional, Dict
-from sortedcontainers import SortedDict
-from .orders import Order, OrderSide
+from array import array
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Dict
+from .orders import SIDE_BUY, Order, tick_to_price
 
 class Limit:
     """
     Represents a single price level in the order book.
 
-    This class holds all orders at a specific price, forming a queue
-    implemented as a doubly-linked list.
+    This class holds the IDs of all orders at a specific price in a FIFO
+    queue. Cancelling the order at either end pops it; cancelling any other
+    order leaves its ID behind as a tombstone, recognisable because the ID
+    is no longer live in the book, which matching skips and pops. The book
+    compacts a queue once tombstones dominate it, so it stays bounded.
+    `total_volume` and `order_count` only ever cover live orders.
     """
-    def __init__(self, price: float):
-        self.price = price
+    __slots__ = ('tick', 'total_volume', 'order_count', 'queue')
+
+    def __init__(self, tick: int):
+        self.tick = tick
         self.total_volume: int = 0
         self.order_count: int = 0
-        
-        # Pointers to the head and tail of the order queue (doubly-linked list)
-        self.head_order: Optional[Order] = None
-        self.tail_order: Optional[Order] = None
-
-        # Binary tree pointers (conceptual - managed by SortedDict)
-        # self.parent = None
-        # self.left_child = None
-        # self.right_child = None
-        
+
+        # Order IDs in time priority, possibly interleaved with tombstones
+        self.queue: Deque[int] = deque()
+
     def add_order(self, order: Order):
         """Adds an order to the end of the queue at this price level."""
-        if self.head_order is None:
-            self.head_order = order
-            self.tail_order = order
-        else:
-            self.tail_order.next_order = order
-            order.prev_order = self.tail_order
-            self.tail_order = order
-        
+        self.queue.append(order.order_id)
         self.total_volume += order.quantity
         self.order_count += 1
         order.parent_limit = self
@@ -50,64 +46,155 @@ class Limit:
         self.total_volume -= order.quantity
         self.order_count -= 1
 
-        if order.prev_order:
-            order.prev_order.next_order = order.next_order
-        if order.next_order:
-            order.next_order.prev_order = order.prev_order
+        queue = self.queue
+        if queue:
+            if queue[0] == order.order_id:
+                queue.popleft()
+            elif queue[-1] == order.order_id: # Cancelling the newest order
+                queue.pop()
 
-        if self.head_order == order:
-            self.head_order = order.next_order
-        if self.tail_order == order:
-            self.tail_order = order.prev_order
-            
         order.parent_limit = None
 
+    def needs_compaction(self) -> bool:
+        """True once tombstones outnumber the live orders in the queue by enough to compact."""
+        return len(self.queue) > 2 * self.order_count + 8
+
+    def compact(self, live_orders: Dict[int, Order]):
+        """Rebuilds the queue from the IDs still live in `live_orders`, dropping tombstones."""
+        self.queue = deque(order_id for order_id in self.queue if order_id in live_orders)
+
+    @property
+    def price(self) -> float:
+        """The price of this level."""
+        return tick_to_price(self.tick)
+
     def __repr__(self):
         return f"Limit(Price={self.price}, Vol={self.total_volume}, Orders={self.order_count})"
 
+class PriceLadder:
+    """
+    Indexes the price levels of one side of the book by tick.
+
+    Levels live in a flat list indexed by their offset from `min_tick`.
+    Occupancy is kept in a two-level bitset: bit j of `_words[i]` is set when
+    offset i * 64 + j holds orders, and bit i of `_summary` is set when
+    `_words[i]` is non-zero. Empty Limits stay in the list and are reused.
+
+    The best occupied Limit is cached in `best_level` and only rescanned from
+    the bitset when that level empties.
+    """
+    def __init__(self, min_tick: int, max_tick: int, descending: bool):
+        """
+        Args:
+            min_tick: The lowest tick this side can hold.
+            max_tick: The highest tick this side can hold.
+            descending: True if the best level is the highest price (bids).
+        """
+        self.min_tick = min_tick
+        self.max_tick = max_tick
+        self.descending = descending
+        size = max_tick - min_tick + 1
+        self._levels: List[Optional[Limit]] = [None] * size
+        self._words = array('Q', bytes(8 * ((size + 63) >> 6)))
+        self._summary = 0
+        self.best_level: Optional[Limit] = None
+
+    def get_level(self, tick: int) -> Limit:
+        """Returns the Limit at `tick`, marking it as occupied."""
+        ix = tick - self.min_tick
+        if ix < 0 or tick > self.max_tick:
+            raise ValueError(f"Tick {tick} is outside the book range "
+                             f"({self.min_tick} - {self.max_tick}).")
+        limit = self._levels[ix]
+        if limit is None:
+            limit = self._levels[ix] = Limit(tick)
+        if limit.order_count == 0:
+            w = ix >> 6
+            self._words[w] |= 1 << (ix & 63)
+            self._summary |= 1 << w
+            best = self.best_level
+            if best is None or (tick > best.tick if self.descending else tick < best.tick):
+                self.best_level = limit
+        return limit
+
+    def discard(self, limit: Limit):
+        """Marks an emptied Limit as unoccupied, dropping any tombstones it holds."""
+        limit.queue.clear()
+        ix = limit.tick - self.min_tick
+        w = ix >> 6
+        word = self._words[w] & ~(1 << (ix & 63))
+        self._words[w] = word
+        if not word:
+            self._summary &= ~(1 << w)
+        if limit is self.best_level:
+            self.best_level = self._scan_best()
+
+    def _scan_best(self) -> Optional[Limit]:
+        """Finds the best occupied Limit from the bitset."""
+        summary = self._summary
+        if not summary:
+            return None
+        if self.descending:
+            w = summary.bit_length() - 1
+            ix = (w << 6) | (self._words[w].bit_length() - 1)
+        else:
+            w = (summary & -summary).bit_length() - 1
+            word = self._words[w]
+            ix = (w << 6) | ((word & -word).bit_length() - 1)
+        return self._levels[ix]
+
+    def __iter__(self) -> Iterator[Limit]:
+        """Yields occupied Limits from best to worst."""
+        words = self._words
+        w_range = range(len(words) - 1, -1, -1) if self.descending else range(len(words))
+        for w in w_range:
+            word = words[w]
+            if not word:
+                continue
+            bits = range(63, -1, -1) if self.descending else range(64)
+            for j in bits:
+                if word >> j & 1:
+                    yield self._levels[(w << 6) | j]
+
+    def __bool__(self) -> bool:
+        return self._summary != 0
+
 class OrderBook:
     """
     The main OrderBook engine.
 
     It manages the buy and sell sides of the book, holding price Limits in
-    efficient sorted data structures.
+    tick-indexed ladders that span the daily price band.
     """
-    def __init__(self):
-        # Bids are stored in descending order of price (best price is highest)
-        # We achieve this by negating the price keys.
-        self.bids: SortedDict[float, Limit] = SortedDict()
-        
-        # Asks are stored in ascending order of price (best price is lowest)
-        self.asks: SortedDict[float, Limit] = SortedDict()
-        
+    def __init__(self, min_tick: int, max_tick: int):
+        """
+        Args:
+            min_tick: The lowest price an order may rest at, in ticks.
+            max_tick: The highest price an order may rest at, in ticks.
+        """
+        # Bids are ordered best-first by descending price
+        self.bids = PriceLadder(min_tick, max_tick, descending=True)
+
+        # Asks are ordered best-first by ascending price
+        self.asks = PriceLadder(min_tick, max_tick, descending=False)
+
         # Direct access to all active orders for O(1) cancellation
         self._orders: Dict[int, Order] = {}
 
     def add_order(self, order: Order):
         """
         Adds a new limit order to the book.
-        
+
         Note: Market orders are handled by the MatchingEngine, not added here.
         """
         if order.order_id in self._orders:
             raise ValueError(f"Order with ID {order.order_id} already exists.")
 
-        price = order.price
-        if order.side == OrderSide.BUY:
-            book_side = self.bids
-            # Use negative price for key to sort bids descendingly
-            key = -price
-        else:
-            book_side = self.asks
-            key = price
-
-        if key not in book_side:
-            book_side[key] = Limit(price)
-            
-        limit_level = book_side[key]
+        book_side = self.bids if order.side_int == SIDE_BUY else self.asks
+        limit_level = book_side.get_level(order.price_tick)
         limit_level.add_order(order)
         self._orders[order.order_id] = order
-        
+
     def cancel_order(self, order_id: int) -> Optional[Order]:
         """
         Cancels an existing order from the book in O(1) time.
@@ -119,31 +206,38 @@ class OrderBook:
         limit_level = order.parent_limit
         if limit_level:
             limit_level.remove_order(order)
-            
-            # If the limit level is now empty, remove it from the book
+
+            # If the limit level is now empty, mark it as unoccupied
             if limit_level.order_count == 0:
-                if order.side == OrderSide.BUY:
-                    del self.bids[-limit_level.price]
+                if order.side_int == SIDE_BUY:
+                    self.bids.discard(limit_level)
                 else:
-                    del self.asks[limit_level.price]
+                    self.asks.discard(limit_level)
+            elif limit_level.needs_compaction():
+                limit_level.compact(self._orders)
         return order
 
     @property
     def best_bid(self) -> Optional[float]:
         """Returns the highest bid price, or None if no bids exist."""
-        if not self.bids:
-            return None
-        # The first key in bids SortedDict is the highest bid (due to negative key)
-        return self.bids.peekitem(0)[1].price
+        limit = self.bids.best_level
+        return limit.price if limit else None
 
     @property
     def best_ask(self) -> Optional[float]:
         """Returns the lowest ask price, or None if no asks exist."""
-        if not self.asks:
-            return None
-        # The first key in asks SortedDict is the lowest ask
-        return self.asks.peekitem(0)[1].price
-        
+        limit = self.asks.best_level
+        return limit.price if limit else None
+
+    @property
+    def live_orders(self) -> Dict[int, Order]:
+        """
+        The index of resting orders by ID. The matching loop removes fully
+        filled makers from it directly; other callers should treat it as
+        read-only and go through add_order/cancel_order.
+        """
+        return self._orders
+
     def get_order(self, order_id: int) -> Optional[Order]:
         """Retrieves an order by its ID."""
         return self._orders.get(order_id)
@@ -151,15 +245,15 @@ class OrderBook:
     def __repr__(self):
         # Create a visual representation of the order book
         lines = []
-        
-        # Asks (sorted ascending)
-        for _, limit in reversed(self.asks.items()):
+
+        # Asks (highest price at the top)
+        for limit in reversed(list(self.asks)):
             lines.append(f"ASK: {limit.price:.2f} | {limit.total_volume}")
-        
+
         lines.append("-" * 30)
 
         # Bids (sorted descending)
-        for _, limit in self.bids.items():
+        for limit in self.bids:
             lines.append(f"BID: {limit.price:.2f} | {limit.total_volume}")
-            
+
         return "\n".join(lines)
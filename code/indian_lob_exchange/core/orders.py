@@ -3,14 +3,33 @@ Contains the definitions for Order objects and an object pool for memory efficie
 """
 from __future__ import annotations
 from collections import deque
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, TYPE_CHECKING
+from itertools import repeat
+from typing import Optional, Union, TYPE_CHECKING
 
 # This block is only executed during static type checking, not at runtime.
 # without causing a circular import error.
 if TYPE_CHECKING:
     from .order_book import Limit
 
+# Minimum price increment. Prices are held internally as integer multiples of this.
+TICK_SIZE = 0.01
+_TICKS_PER_UNIT = round(1 / TICK_SIZE)
+
+def price_to_tick(price: float) -> int:
+    """Converts a price to the nearest whole number of ticks."""
+    return int(round(price * _TICKS_PER_UNIT))
+
+def is_on_tick(price: float) -> bool:
+    """True if a price is a whole number of ticks, allowing for float noise."""
+    ticks = price * _TICKS_PER_UNIT
+    return abs(ticks - round(ticks)) < 1e-6
+
+def tick_to_price(tick: int) -> float:
+    """Converts a number of ticks back to a price."""
+    return tick / _TICKS_PER_UNIT
+
 class OrderSide(Enum):
     """Enumeration for order side (BUY or SELL)."""
     BUY = 1
@@ -24,16 +43,42 @@ class OrderType(Enum):
     IOC = 4
     FOK = 5
 
+# Plain int values of the enum members, for cheap comparisons in hot paths
+SIDE_BUY = OrderSide.BUY.value
+SIDE_SELL = OrderSide.SELL.value
+TYPE_MARKET = OrderType.MARKET.value
+TYPE_LIMIT = OrderType.LIMIT.value
+
+@dataclass(slots=True, frozen=True)
+class OrderRequest:
+    """
+    An order submission, passed to Exchange.submit_request as one object
+    instead of keyword arguments.
+
+    side and order_type may be OrderSide and OrderType members or their int
+    values, as with submit_order; ints skip the enum handling. The limit
+    price is in ticks (None for orders without one).
+    """
+    agent_id: int
+    side: Union[OrderSide, int]
+    quantity: int
+    order_type: Union[OrderType, int]
+    price_tick: Optional[int] = None
+    trigger_price: Optional[float] = None
+
 class Order:
     """
     Represents a single order in the Limit Order Book.
 
-    This object is designed to be part of a doubly-linked list at its price level (Limit),
-    allowing for O(1) cancellation.
+    Resting orders are queued by ID at their price level (Limit) and indexed by
+    the OrderBook, allowing for O(1) cancellation.
     """
+    __slots__ = ('order_id', 'agent_id', 'side', 'side_int', 'quantity', 'order_type', 'type_int',
+                 'timestamp', 'price_tick', 'trigger_price', 'parent_limit')
+
     def __init__(self, order_id: int, agent_id: int, side: OrderSide, 
                  quantity: int, order_type: OrderType, timestamp: float, 
-                 price: Optional[float] = None, trigger_price: Optional[float] = None):
+                 price_tick: Optional[int] = None, trigger_price: Optional[float] = None):
         """
         Initializes an Order object.
         
@@ -44,25 +89,39 @@ class Order:
             quantity: The number of shares.
             order_type: The type of the order (MARKET, LIMIT, etc.).
             timestamp: The time the order was placed.
-            price: The limit price for LIMIT orders.
+            price_tick: The limit price for LIMIT orders, in ticks.
             trigger_price: The price for activating a STOP_LOSS order.
         """
+        self.reset(order_id, agent_id, side, quantity, order_type,
+                   timestamp, price_tick, trigger_price)
+
+    def reset(self, order_id: int, agent_id: int, side: OrderSide,
+              quantity: int, order_type: OrderType, timestamp: float,
+              price_tick: Optional[int], trigger_price: Optional[float]):
+        """
+        Re-initializes every field in place, so pooled orders can be reused
+        without re-running __init__. Takes the same arguments as __init__.
+        """
         self.order_id = order_id
         self.agent_id = agent_id
         self.side = side
         self.quantity = quantity
         self.order_type = order_type
+        # Plain int copies of the enum values for cheap comparisons in hot paths
+        self.side_int = side.value
+        self.type_int = order_type.value
         self.timestamp = timestamp
-        self.price = price
+        self.price_tick = price_tick
         self.trigger_price = trigger_price
 
-        # Pointers for the doubly-linked list at a Limit (price) level
-        self.next_order: Optional[Order] = None
-        self.prev_order: Optional[Order] = None
-        
         # Reference to the parent Limit object
         self.parent_limit: Optional[Limit] = None
 
+    @property
+    def price(self) -> Optional[float]:
+        """The limit price, or None for orders without one."""
+        return None if self.price_tick is None else tick_to_price(self.price_tick)
+
     def __repr__(self):
         return (f"Order(ID={self.order_id}, Side={self.side.name}, Qty={self.quantity}, "
                 f"Price={self.price}, Type={self.order_type.name})")
@@ -79,12 +138,15 @@ class OrderPool:
         self._expand_pool(initial_size)
 
     def _expand_pool(self, size: int):
-        """Creates new Order objects and adds them to the pool."""
-        for _ in range(size):
-            # Initialize with dummy values
-            self._pool.append(Order(0, 0, OrderSide.BUY, 0, OrderType.LIMIT, 0.0))
+        """
+        Creates new Order objects and adds them to the pool.
+        The objects are left uninitialized; get_order() sets every field via reset().
+        """
+        self._pool.extend(map(object.__new__, repeat(Order, size)))
 
-    def get_order(self, *args, **kwargs) -> Order:
+    def get_order(self, order_id: int, agent_id: int, side: OrderSide,
+                  quantity: int, order_type: OrderType, timestamp: float,
+                  price_tick: Optional[int] = None, trigger_price: Optional[float] = None) -> Order:
         """
         Retrieves an order from the pool and re-initializes it with new parameters.
         If the pool is empty, it expands it.
@@ -94,16 +156,15 @@ class OrderPool:
         
         order = self._pool.popleft()
         # Re-initialize the recycled order object
-        order.__init__(*args, **kwargs)
+        order.reset(order_id, agent_id, side, quantity, order_type,
+                    timestamp, price_tick, trigger_price)
         return order
 
     def release_order(self, order: Order):
         """
         Resets an Order object and returns it to the pool for future use.
         """
-        # Reset pointers and parent references to prevent memory leaks
-        order.next_order = None
-        order.prev_order = None
+        # Reset the parent reference to prevent memory leaks
         order.parent_limit = None
         self._pool.append(order)
 
@@ -1,62 +1,214 @@
 """
 The main Exchange class that orchestrates all components.
 """
-from datetime import datetime
-from typing import List, Tuple
-from .core.orders import Order, OrderPool
+import time
+from datetime import time as time_of_day
+from typing import Iterable, List, Optional, Tuple, Union
+from .core.orders import (SIDE_BUY, TYPE_LIMIT, TYPE_MARKET, Order, OrderPool, OrderRequest,
+                          OrderSide, OrderType, price_to_tick)
 from .core.order_book import OrderBook
-from .core.matching_engine import MatchingEngine, Trade
+from .core.matching_engine import MatchingEngine, TradeRange, match_book
 from .indian_market.sebi_compliance import SEBIComplianceEngine
 
+# Enum members by value, for building orders from the integer fast path
+_SIDES = {side.value: side for side in OrderSide}
+_ORDER_TYPES = {order_type.value: order_type for order_type in OrderType}
+
+# The trades of one order: a view into the trade log, or an empty tuple if none
+Trades = Union[TradeRange, Tuple[()]]
+
 class Exchange:
     """
     The central exchange, managing the order book, matching, and compliance.
     """
+    # Shared result for orders that produce no trades, so none allocates one
+    _EMPTY_TRADES = ()
+
     def __init__(self, reference_price: float, stock_category: str = 'default'):
-        self.order_book = OrderBook()
-        self.matching_engine = MatchingEngine(self.order_book)
         self.compliance_engine = SEBIComplianceEngine(reference_price, stock_category)
+        # The book only needs to index prices that can pass the price band check
+        circuit_breaker = self.compliance_engine.circuit_breaker
+        self.order_book = OrderBook(circuit_breaker.lower_band_tick, circuit_breaker.upper_band_tick)
+        self.matching_engine = MatchingEngine(self.order_book)
         self.order_pool = OrderPool()
         self._order_id_counter = 0
 
+        # Direct references for submit_order_fast, so it avoids attribute walks
+        self._circuit_breaker = circuit_breaker
+        self._allowed_types = self.compliance_engine.allowed_types
+        self._lo_tick = circuit_breaker.lower_band_tick
+        self._hi_tick = circuit_breaker.upper_band_tick
+        self._book_bids = self.order_book.bids
+        self._book_asks = self.order_book.asks
+        self._book_orders = self.order_book.live_orders
+        self._trade_log = self.matching_engine.trade_log
+
+        # Timestamps of the session boundaries either side of the cached
+        # session rules. They are refreshed by the first order outside
+        # [_session_start, _next_session_boundary), which also covers
+        # simulation time that goes backwards.
+        self._session_start = float('inf')
+        self._next_session_boundary = float('-inf')
+
     def _get_next_order_id(self) -> int:
         self._order_id_counter += 1
         return self._order_id_counter
 
-    def _get_current_time(self) -> datetime:
-        """In a real simulation, this would come from the simulation clock."""
-        return datetime.now()
+    def _get_current_timestamp(self) -> float:
+        """Wall-clock time in seconds, used when no simulation time is supplied."""
+        return time.time()
+
+    def _get_time_of_day(self, timestamp: float) -> time_of_day:
+        """
+        Returns the local time of day for a timestamp without building a
+        datetime. The UTC offset is looked up for the timestamp itself, so
+        simulation dates on either side of a DST change are handled.
+        """
+        return time_of_day(*time.localtime(timestamp)[3:6])
+
+    def _advance_session(self, timestamp: float):
+        """
+        Refreshes the compliance engine's cached session rules for `timestamp`
+        and finds the timestamps of the session boundaries either side of it.
+        """
+        now = time.localtime(timestamp)
+        current_time = time_of_day(*now[3:6])
+        self.compliance_engine.invalidate_session(current_time)
+
+        boundaries = self.compliance_engine.session_manager.SESSION_BOUNDARIES
+        later = [i for i, b in enumerate(boundaries) if b > current_time]
+        day = now.tm_mday
+        if not later: # Past the last boundary: from it until tomorrow's first
+            start, start_day = boundaries[-1], day
+            end, end_day = boundaries[0], day + 1
+        elif later[0] == 0: # Before the first boundary: from yesterday's last until it
+            start, start_day = boundaries[-1], day - 1
+            end, end_day = boundaries[0], day
+        else:
+            start, start_day = boundaries[later[0] - 1], day
+            end, end_day = boundaries[later[0]], day
+        # mktime normalises the day and applies the UTC offset in force at each boundary
+        self._session_start = time.mktime((now.tm_year, now.tm_mon, start_day, start.hour,
+                                           start.minute, start.second, 0, 0, -1))
+        self._next_session_boundary = time.mktime((now.tm_year, now.tm_mon, end_day, end.hour,
+                                                   end.minute, end.second, 0, 0, -1))
 
-    def submit_order(self, agent_id: int, side, quantity: int, order_type, 
-                     price: float = None, trigger_price: float = None) -> Tuple[bool, str, List[Trade]]:
+    def submit_order(self, agent_id: int, side: Union[OrderSide, int], quantity: int,
+                     order_type: Union[OrderType, int],
+                     price: float = None, trigger_price: float = None,
+                     timestamp: Optional[float] = None,
+                     price_tick: Optional[int] = None) -> Tuple[bool, str, Trades]:
         """
         Primary entry point for agents to submit orders.
+
+        `side` and `order_type` may be enum members or their int values; ints
+        skip the enum handling. The limit price may be given either as `price`
+        or directly in ticks as `price_tick`, which skips the conversion; a
+        `price` that is not a whole number of ticks is rejected. `timestamp`
+        is the simulation time in seconds since the epoch; the wall clock is
+        read if it is omitted.
+
+        The returned trades are a view into the matching engine's trade log
+        and should be consumed before further orders overwrite it. Orders that
+        do not trade return an empty tuple instead.
+        """
+        # Prices are held as integer ticks from here on. Off-tick prices are
+        # rejected rather than rounded, which could move them across the
+        # price band or the opposite side's best price.
+        if price_tick is None and price is not None:
+            reason = self.compliance_engine.check_tick_size(price)
+            if reason is not None:
+                return False, reason, self._EMPTY_TRADES
+            price_tick = price_to_tick(price)
+
+        return self._route(agent_id, side, quantity, order_type, price_tick, trigger_price, timestamp)
+
+    def submit_request(self, request: OrderRequest,
+                       timestamp: Optional[float] = None) -> Tuple[bool, str, Trades]:
+        """
+        Submits the order described by `request`. Equivalent to passing its
+        fields to submit_order, and returns the same result.
+        """
+        return self._route(request.agent_id, request.side, request.quantity, request.order_type,
+                           request.price_tick, request.trigger_price, timestamp)
+
+    def submit_orders_bulk(self, orders: Iterable[Tuple[int, Union[OrderSide, int], int,
+                                                        Union[OrderType, int], Optional[int]]],
+                           timestamp: Optional[float] = None) -> List[Tuple[bool, str, Trades]]:
+        """
+        Submits a batch of orders in one call, in sequence, as if each had been
+        passed to submit_order.
+
+        Args:
+            orders: (agent_id, side, quantity, order_type, price_tick) entries.
+                side and order_type may be enum members or their int values.
+                price_tick is None for orders without a limit price.
+            timestamp: The simulation time shared by the whole batch; the wall
+                clock is read once if it is omitted.
+
+        Returns:
+            The submit_order result for each order, in order.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+        route = self._route
+        return [route(agent_id, side, quantity, order_type, price_tick, None, timestamp)
+                for agent_id, side, quantity, order_type, price_tick in orders]
+
+    def _route(self, agent_id: int, side: Union[OrderSide, int], quantity: int,
+               order_type: Union[OrderType, int], price_tick: Optional[int],
+               trigger_price: Optional[float], timestamp: Optional[float]) -> Tuple[bool, str, Trades]:
+        """
+        Normalises `side` and `order_type` to their int values and sends the
+        order down the fused or the general path. Shared by the public
+        submission methods, so they all accept the same forms.
+        """
+        side_int = side.value if isinstance(side, OrderSide) else side
+        order_type_int = order_type.value if isinstance(order_type, OrderType) else order_type
+
+        # MARKET and LIMIT orders take the fused path
+        if order_type_int <= TYPE_LIMIT and trigger_price is None:
+            return self.submit_order_fast(agent_id, side_int, quantity, order_type_int,
+                                          price_tick, timestamp)
+        return self._submit_order(agent_id, _SIDES[side_int], quantity, _ORDER_TYPES[order_type_int],
+                                  price_tick, trigger_price, timestamp)
+
+    def _submit_order(self, agent_id: int, side: OrderSide, quantity: int, order_type: OrderType,
+                      price_tick: Optional[int], trigger_price: Optional[float],
+                      timestamp: Optional[float]) -> Tuple[bool, str, Trades]:
         """
-        current_dt = self._get_current_time()
-        current_time = current_dt.time()
-        timestamp = current_dt.timestamp()
+        General submission path: validates, matches and runs post-trade checks
+        through the compliance and matching engines.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+        if not self._session_start <= timestamp < self._next_session_boundary:
+            self._advance_session(timestamp)
 
         # Create order using the pool
         order_id = self._get_next_order_id()
         order = self.order_pool.get_order(
-            order_id, agent_id, side, quantity, order_type, 
-            timestamp, price, trigger_price
+            order_id, agent_id, side, quantity, order_type,
+            timestamp, price_tick, trigger_price
         )
 
         # 1. Compliance Validation
-        is_valid, reason = self.compliance_engine.validate_order(order, current_time)
-        if not is_valid:
+        reason = self.compliance_engine.validate_order(order)
+        if reason is not None:
             self.order_pool.release_order(order)
-            return False, reason, []
+            return False, reason, self._EMPTY_TRADES
 
         # 2. Order Matching
-        trades, _ = self.matching_engine.match_order(order)
+        (start, end), _ = self.matching_engine.match_order(order)
 
         # 3. Post-Trade Compliance Checks
-        if trades:
-            last_trade_price = trades[-1].price
-            self.compliance_engine.post_trade_check(last_trade_price, current_time)
-        
+        if start == end:
+            trades = self._EMPTY_TRADES
+        else:
+            trades = self.matching_engine.trade_log.slice(start, end)
+            last_trade_price_tick = trades[-1].price_tick
+            self.compliance_engine.post_trade_check(last_trade_price_tick, self._get_time_of_day(timestamp))
+
         # If the original order object was mutated and not fully filled, it now rests
         # in the book. If it was fully filled, its quantity is 0. If it was a market
         # order that was not fully filled and cancelled, its quantity is > 0.
@@ -64,6 +216,115 @@ class Exchange:
 
         return True, "Order accepted.", trades
 
+    def _passes_inline_checks(self, type_int: int, price_tick: Optional[int], timestamp: float) -> bool:
+        """
+        The pre-trade checks of SEBIComplianceEngine.validate_order, read from
+        cached references. Shared by the fast entry points; orders that fail
+        take the general path, which reports the reason. The session rules
+        are refreshed first if `timestamp` is outside the cached session.
+        """
+        if not self._session_start <= timestamp < self._next_session_boundary:
+            self._advance_session(timestamp)
+        return not (self._circuit_breaker.market_halted or type_int not in self._allowed_types or
+                    (type_int == TYPE_LIMIT if price_tick is None
+                     else not (self._lo_tick <= price_tick <= self._hi_tick)))
+
+    def submit_order_fast(self, agent_id: int, side_int: int, quantity: int, type_int: int,
+                          price_tick: Optional[int] = None,
+                          timestamp: Optional[float] = None) -> Tuple[bool, str, Trades]:
+        """
+        Submits a MARKET or LIMIT order given as plain ints, with the price in ticks.
+
+        The pre-trade checks are read from cached references and the order
+        is matched directly, so an accepted order does not pass through the
+        compliance engine or MatchingEngine.match_order. Orders that would be
+        rejected take the general path, which reports the reason. Returns the
+        same result as submit_order.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+
+        # 1. Inline compliance validation
+        if not self._passes_inline_checks(type_int, price_tick, timestamp):
+            return self._submit_order(agent_id, _SIDES[side_int], quantity, _ORDER_TYPES[type_int],
+                                      price_tick, None, timestamp)
+
+        trade_log = self._trade_log
+        start = trade_log.write_index
+        self._execute(agent_id, side_int, quantity, type_int, price_tick, timestamp)
+        end = trade_log.write_index
+        if start == end:
+            return True, "Order accepted.", self._EMPTY_TRADES
+        return True, "Order accepted.", trade_log.slice(start, end)
+
+    def _execute(self, agent_id: int, side_int: int, quantity: int, type_int: int,
+                 price_tick: Optional[int], timestamp: float) -> int:
+        """
+        Matches and books a MARKET or LIMIT order that has passed the inline
+        pre-trade checks, then runs the post-trade checks. Returns its order ID.
+        """
+        self._order_id_counter += 1
+        order_id = self._order_id_counter
+        order = self.order_pool.get_order(
+            order_id, agent_id, _SIDES[side_int], quantity, _ORDER_TYPES[type_int],
+            timestamp, price_tick, None
+        )
+
+        # 2. Order matching, with the loop shared by MatchingEngine.match_order
+        trade_log = self._trade_log
+        start = trade_log.write_index
+        is_buy = side_int == SIDE_BUY
+        is_limit = type_int == TYPE_LIMIT
+        quantity = match_book(self._book_asks if is_buy else self._book_bids, self._book_orders,
+                               order_id, is_buy, price_tick if is_limit else None, quantity,
+                               timestamp, trade_log, [])
+
+        order.quantity = quantity
+        if quantity > 0 and is_limit:
+            self.order_book.add_order(order)
+
+        # 3. Post-Trade Compliance Checks
+        end = trade_log.write_index
+        if end != start:
+            self.compliance_engine.post_trade_check(trade_log.last_price_tick, self._get_time_of_day(timestamp))
+
+        return order_id
+
+    def submit_limit(self, side: int, quantity: int, price_tick: int,
+                     agent_id: int = 0, timestamp: Optional[float] = None) -> int:
+        """
+        Typed facade for drivers: submits a LIMIT order given as plain ints.
+
+        Behaves like submit_order_fast but builds no result tuple or trade
+        view; executed trades can still be read from the trade log.
+
+        Returns:
+            The new order's ID, or 0 if the order was rejected.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+        if not self._passes_inline_checks(TYPE_LIMIT, price_tick, timestamp):
+            self._submit_order(agent_id, _SIDES[side], quantity, OrderType.LIMIT,
+                               price_tick, None, timestamp)
+            return 0
+        return self._execute(agent_id, side, quantity, TYPE_LIMIT, price_tick, timestamp)
+
+    def submit_market(self, side: int, quantity: int,
+                      agent_id: int = 0, timestamp: Optional[float] = None) -> int:
+        """
+        Typed facade for drivers: submits a MARKET order given as plain ints.
+
+        Returns:
+            The new order's ID, or 0 if the order was rejected.
+        """
+        if timestamp is None:
+            timestamp = self._get_current_timestamp()
+        if not self._passes_inline_checks(TYPE_MARKET, None, timestamp):
+            self._submit_order(agent_id, _SIDES[side], quantity, OrderType.MARKET,
+                               None, None, timestamp)
+            return 0
+        return self._execute(agent_id, side, quantity, TYPE_MARKET, None, timestamp)
+
     def cancel_order(self, order_id: int) -> bool:
         """
         Allows an agent to cancel a pending order.
@@ -1,7 +1,13 @@
 """
 Implements SEBI-compliant circuit breaker and price band logic.
 """
+import math
 from datetime import time
+from types import MappingProxyType
+from ..core.orders import TICK_SIZE, price_to_tick, tick_to_price
+
+# Shared, read-only result for the common case where no breaker is hit
+_NOT_TRIGGERED = MappingProxyType({"triggered": False})
 
 class CircuitBreakerMonitor:
     """
@@ -21,8 +27,17 @@ class CircuitBreakerMonitor:
         "default": 0.20
     }
 
+    # Index breaker levels by the number of thresholds crossed (0 means none)
+    _BREAKER_LEVELS = (0, 0.10, 0.15, 0.20)
+
+    # Halt windows, indexed by the number of window start times already passed
+    _WINDOWS = ("before_1pm", "1pm_to_230pm", "after_230pm")
+    _WINDOW_STARTS = (time(13, 0), time(14, 30))
+
     def __init__(self, reference_price: float, stock_category: str = "default"):
         self.reference_price = reference_price
+        # Reciprocal of the reference price, so each check multiplies instead of dividing
+        self._inv_reference_price = 1.0 / reference_price
         self.stock_category = stock_category
         self.market_halted = False
         self.halt_end_time = None
@@ -30,51 +45,60 @@ class CircuitBreakerMonitor:
         self._price_band = self._get_price_band()
         self.upper_band = self.reference_price * (1 + self._price_band)
         self.lower_band = self.reference_price * (1 - self._price_band)
+        # The band in whole ticks, computed once so each check is two integer
+        # comparisons. Rounded inwards, since rounding to the nearest tick could
+        # admit a price just outside a band edge that is not on a tick.
+        # round(..., 6) absorbs float noise such as 110.00000000000001.
+        # This matches the float band only for prices on a tick; off-tick
+        # prices are rejected before they reach this check.
+        self.upper_band_tick = math.floor(round(self.upper_band / TICK_SIZE, 6))
+        self.lower_band_tick = math.ceil(round(self.lower_band / TICK_SIZE, 6))
+
+        # Moves of fewer ticks than this cannot reach the lowest breaker level.
+        # Rounded down, so prices near the threshold still get the full check.
+        self._reference_tick = price_to_tick(reference_price)
+        self._min_breaker_move_ticks = int(self._BREAKER_LEVELS[1] * reference_price / TICK_SIZE)
 
     def _get_price_band(self) -> float:
         """Determines the price band percentage for the stock."""
         band_info = self.STOCK_PRICE_BANDS.get(self.stock_category, self.STOCK_PRICE_BANDS["default"])
         return band_info["band"] if isinstance(band_info, dict) else band_info
         
-    def check_price_band(self, order_price: float) -> bool:
+    def check_price_band(self, order_price_tick: int) -> bool:
         """
-        Validates if an order's price is within the daily price band.
+        Validates if an order's price, in ticks, is within the daily price band.
         Returns True if valid, False otherwise.
         """
-        if self.lower_band <= order_price <= self.upper_band:
+        if self.lower_band_tick <= order_price_tick <= self.upper_band_tick:
             return True
         return False
 
-    def check_index_circuit_breaker(self, current_price: float, current_time: time) -> dict:
+    def check_index_circuit_breaker(self, current_price_tick: int, current_time: time) -> dict:
         """
-        Checks if the current price triggers an index-level circuit breaker.
-        
-        Returns a dictionary with halt information if triggered.
+        Checks if the current price, in ticks, triggers an index-level circuit breaker.
+
+        Returns a dictionary with halt information if triggered. The
+        not-triggered result is a shared read-only mapping.
         """
-        price_change = abs(current_price - self.reference_price) / self.reference_price
-        
-        triggered_level = 0
-        if price_change >= 0.20:
-            triggered_level = 0.20
-        elif price_change >= 0.15:
-            triggered_level = 0.15
-        elif price_change >= 0.10:
-            triggered_level = 0.10
-            
-        if not triggered_level:
-            return {"triggered": False}
+        if abs(current_price_tick - self._reference_tick) < self._min_breaker_move_ticks:
+            return _NOT_TRIGGERED
+
+        current_price = tick_to_price(current_price_tick)
+        price_change = abs(current_price - self.reference_price) * self._inv_reference_price
 
+        # Count the thresholds crossed instead of testing them in an if/elif chain
+        level_index = (price_change >= 0.10) + (price_change >= 0.15) + (price_change >= 0.20)
+        if not level_index:
+            return _NOT_TRIGGERED
+
+        triggered_level = self._BREAKER_LEVELS[level_index]
         halt_info = self.INDEX_CIRCUIT_BREAKERS[triggered_level]
 
         if isinstance(halt_info, str): # 20% case
             return {"triggered": True, "action": halt_info}
 
         # 10% or 15% case, depends on time
-        if current_time < time(13, 0):
-            action = halt_info["before_1pm"]
-        elif time(13, 0) <= current_time < time(14, 30):
-            action = halt_info["1pm_to_230pm"]
-        else:
-            action = halt_info["after_230pm"]
-            
+        window_index = (current_time >= self._WINDOW_STARTS[0]) + (current_time >= self._WINDOW_STARTS[1])
+        action = halt_info[self._WINDOWS[window_index]]
+
         return {"triggered": True, "level": triggered_level, "action": action}
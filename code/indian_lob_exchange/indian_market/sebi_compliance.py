@@ -2,11 +2,14 @@
 Integrates all SEBI regulatory components into a single engine.
 """
 from datetime import time
-from typing import Optional, Tuple
-from ..core.orders import Order
+from typing import Optional, Set
+from ..core.orders import TICK_SIZE, TYPE_LIMIT, Order, OrderType, is_on_tick
 from .trading_sessions import TradingSessionManager
 from .circuit_breakers import CircuitBreakerMonitor
 
+_HALTED = "Market is halted due to circuit breaker."
+_NO_LIMIT_PRICE = "LIMIT orders require a limit price."
+
 class SEBIComplianceEngine:
     """
     A facade that enforces SEBI regulations before processing orders
@@ -16,41 +19,90 @@ class SEBIComplianceEngine:
         self.session_manager = TradingSessionManager()
         self.circuit_breaker = CircuitBreakerMonitor(reference_price, stock_category)
 
-    def validate_order(self, order: Order, current_time: time) -> Tuple[bool, str]:
+        # The price band is fixed for the day
+        self._lo_tick = self.circuit_breaker.lower_band_tick
+        self._hi_tick = self.circuit_breaker.upper_band_tick
+
+        # Session rules are cached until invalidate_session() is called. The
+        # session manager currently always reports the regular session.
+        # allowed_types holds integer order type values and is updated in
+        # place, so callers may keep a reference to it.
+        self.allowed_types: Set[int] = set()
+        self._set_session("regular")
+
+    def _set_session(self, session: str):
+        """
+        Caches the allowed order types and rejection reasons for a session,
+        keyed by the integer order type value.
+        """
+        allowed_types = self.session_manager.SESSION_RULES.get(session, set())
+        self.allowed_types.clear()
+        self.allowed_types.update(order_type.value for order_type in allowed_types)
+        self._session_denials = {
+            order_type.value: f"{order_type.name} orders not allowed in {session} session."
+            for order_type in OrderType
+        }
+
+    def invalidate_session(self, current_time: time):
+        """
+        Refreshes the cached session rules. Call this when the simulation
+        clock crosses a trading session boundary; the Exchange does so when
+        an order's timestamp passes the next of the session manager's
+        SESSION_BOUNDARIES.
+        """
+        self._set_session(self.session_manager.get_current_session(current_time))
+
+    def validate_order(self, order: Order) -> Optional[str]:
         """
         Performs all pre-trade compliance checks on a new order.
+        Session rules come from the cache kept by invalidate_session(),
+        so no clock reading is needed here.
 
         Args:
             order: The order to be validated.
-            current_time: The current simulation time.
-        
+
         Returns:
-            A tuple (is_valid, reason_string).
+            None if the order is compliant, otherwise the reason it was rejected.
         """
         # 1. Check if trading is halted
         if self.circuit_breaker.market_halted:
             # Add logic here to check if halt_end_time has passed
-            return False, "Market is halted due to circuit breaker."
+            return _HALTED
+
+        # 2. Check the cached trading session rules
+        if order.type_int not in self.allowed_types:
+            return self._session_denials[order.type_int]
 
-        # 2. Check trading session rules
-        if not self.session_manager.is_order_allowed(order.order_type, current_time):
-            session = self.session_manager.get_current_session(current_time)
-            return False, f"{order.order_type.name} orders not allowed in {session} session."
-            
         # 3. Check stock price band for limit orders
-        if order.price and not self.circuit_breaker.check_price_band(order.price):
-            return False, (f"Price {order.price} is outside the price band "
-                           f"({self.circuit_breaker.lower_band:.2f} - {self.circuit_breaker.upper_band:.2f}).")
-            
+        price_tick = order.price_tick
+        if price_tick is None and order.type_int == TYPE_LIMIT:
+            return _NO_LIMIT_PRICE
+        if price_tick is not None and not (self._lo_tick <= price_tick <= self._hi_tick):
+            return (f"Price {order.price} is outside the price band "
+                    f"({self.circuit_breaker.lower_band:.2f} - {self.circuit_breaker.upper_band:.2f}).")
+
         # Add more checks here (e.g., audit trails, tick size)
 
-        return True, "Order is compliant."
+        return None
+
+    def check_tick_size(self, price: float) -> Optional[str]:
+        """
+        Checks that a limit price is a whole number of ticks, before it is
+        converted to ticks for validate_order.
+
+        Returns:
+            None if the price is on a tick, otherwise the reason it was rejected.
+        """
+        if is_on_tick(price):
+            return None
+        return f"Price {price} is not a multiple of the tick size {TICK_SIZE}."
 
-    def post_trade_check(self, trade_price: float, current_time: time):
+    def post_trade_check(self, trade_price_tick: int, current_time: time):
         """
         Performs post-trade checks, primarily for circuit breakers.
+        The trade price is given in ticks.
         """
-        halt_info = self.circuit_breaker.check_index_circuit_breaker(trade_price, current_time)
+        halt_info = self.circuit_breaker.check_index_circuit_breaker(trade_price_tick, current_time)
         if halt_info["triggered"]:
             print(f"CIRCUIT BREAKER TRIGGERED: {halt_info}")
             # Here you would implement the logic to halt the market
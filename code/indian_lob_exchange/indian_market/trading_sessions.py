@@ -16,6 +16,10 @@ class TradingSessionManager:
     REGULAR_END = time(15, 30, 0)
     POST_MARKET_START = time(15, 40, 0)
     POST_MARKET_END = time(16, 0, 0)
+
+    # Times of day at which the session can change, in order
+    SESSION_BOUNDARIES = (PRE_MARKET_START, REGULAR_START, REGULAR_END,
+                          POST_MARKET_START, POST_MARKET_END)
     
     # Define allowed orders per session
     SESSION_RULES = {
@@ -1,65 +1,189 @@
 """
 An example script demonstrating how to use the Indian LOB Exchange.
 This sets up the exchange and simulates a few basic order submissions.
+
+Run with --verbose to also print the order book after each scenario, or
+--quiet to suppress all output (e.g. when profiling the engine).
+Run with --bench to push a large synthetic order flow through the engine
+and report throughput and latency percentiles instead.
 """
+import argparse
+import logging
+import random
+import sys
+import time
+from array import array
 from indian_lob_exchange.exchange import Exchange
-from indian_lob_exchange.core.orders import OrderSide, OrderType
+from indian_lob_exchange.core.orders import OrderRequest, OrderSide, OrderType
+
+log = logging.getLogger(__name__)
+
+# Plain int values of the order enums; the exchange accepts these directly
+BUY, SELL = OrderSide.BUY.value, OrderSide.SELL.value
+LIMIT, MARKET = OrderType.LIMIT.value, OrderType.MARKET.value
+
+# Order prices below are given in integer ticks of core.orders.TICK_SIZE (0.01),
+# so 9900 ticks is a price of 99.00.
+
+# Event kinds in the synthetic order flow generated by drive()
+_CANCEL, _LIMIT_ORDER, _MARKET_ORDER = 0, 1, 2
+_EVENT_NAMES = ("cancel", "limit", "market")
+
+# Scenario script action that submits an order; the only other action, b"C", cancels one
+_SUBMIT = ord("S")
+
+# Per scenario: its heading, whether each action's outcome is logged, and the
+# title of the order book dump that closes it (None for no dump)
+_SCENARIOS = {
+    1: ("Scenario 1: Agents submit limit orders to build the book", False, "Current Order Book"),
+    2: ("Scenario 2: A buyer submits a market order for 10 shares", True, "Order Book After Market Order"),
+    3: ("Scenario 3: Agent 2 cancels their buy order (ID: 2)", True, "Order Book After Cancellation"),
+    4: ("Scenario 4: An agent tries to place an order outside the 10% F&O price band", True, None),
+}
+
+def _log_order_book(exchange: Exchange, title: str):
+    """Logs a full dump of the order book, only when debug output is enabled."""
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("\n--- %s ---\n%s", title, exchange.order_book)
+
+def _log_trades(trades):
+    """Logs an order's trades, if any, as a single record rather than one per trade."""
+    if trades and log.isEnabledFor(logging.INFO):
+        log.info("Trades Executed:\n  - %s", "\n  - ".join(map(str, trades)))
 
 def main():
     """Main simulation function."""
-    print("--- Initializing Indian LOB Exchange Simulation ---")
-    
+    log.info("--- Initializing Indian LOB Exchange Simulation ---")
+
     # Initialize the exchange with a reference price of 100.0 for compliance checks
     exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
-    
-    print("\n--- Current Order Book (Empty) ---")
-    print(exchange.order_book)
-    print("-" * 35)
-
-    # --- SCENARIO 1: Building the book ---
-    print("\n--- Scenario 1: Agents submit limit orders to build the book ---")
-    exchange.submit_order(agent_id=1, side=OrderSide.BUY, quantity=10, order_type=OrderType.LIMIT, price=99.0)
-    exchange.submit_order(agent_id=2, side=OrderSide.BUY, quantity=5, order_type=OrderType.LIMIT, price=98.0)
-    exchange.submit_order(agent_id=3, side=OrderSide.SELL, quantity=8, order_type=OrderType.LIMIT, price=101.0)
-    exchange.submit_order(agent_id=4, side=OrderSide.SELL, quantity=12, order_type=OrderType.LIMIT, price=102.0)
-    
-    print("\n--- Current Order Book ---")
-    print(exchange.order_book)
-    print(f"Best Bid: {exchange.order_book.best_bid}, Best Ask: {exchange.order_book.best_ask}")
-    print("-" * 35)
-    
-    # --- SCENARIO 2: A market order crosses the spread ---
-    print("\n--- Scenario 2: A buyer submits a market order for 10 shares ---")
-    # This should match against the 8 shares at 101.0 first, then 2 shares at 102.0
-    accepted, reason, trades = exchange.submit_order(agent_id=5, side=OrderSide.BUY, quantity=10, order_type=OrderType.MARKET)
-    
-    print(f"Order Accepted: {accepted}, Reason: {reason}")
-    print("Trades Executed:")
-    for trade in trades:
-        print(f"  - {trade}")
-        
-    print("\n--- Order Book After Market Order ---")
-    print(exchange.order_book)
-    print(f"Best Bid: {exchange.order_book.best_bid}, Best Ask: {exchange.order_book.best_ask}")
-    print("-" * 35)
-    
-    # --- SCENARIO 3: Order Cancellation ---
-    print("\n--- Scenario 3: Agent 2 cancels their buy order (ID: 2) ---")
-    cancelled = exchange.cancel_order(2)
-    print(f"Order ID 2 Cancelled Successfully: {cancelled}")
-
-    print("\n--- Order Book After Cancellation ---")
-    print(exchange.order_book)
-    print(f"Best Bid: {exchange.order_book.best_bid}, Best Ask: {exchange.order_book.best_ask}")
-    print("-" * 35)
-    
-    # --- SCENARIO 4: Price Band Violation Check ---
-    print("\n--- Scenario 4: An agent tries to place an order outside the 10% F&O price band ---")
-    # Reference price is 100, F&O band is 10%. Upper band is 110.
-    accepted, reason, trades = exchange.submit_order(agent_id=6, side=OrderSide.BUY, quantity=10, order_type=OrderType.LIMIT, price=111.0)
-    print(f"Order Accepted: {accepted}, Reason: {reason}")
-    print("-" * 35)
+    submit = exchange.submit_request
+    cancel = exchange.cancel_order
+
+    _log_order_book(exchange, "Current Order Book (Empty)")
+    log.info("-" * 35)
+
+    # The scenario script, stored column-wise: row i is one exchange action.
+    # Action b"S" submits an order, b"C" cancels the order in target_ids.
+    # A price of 0 ticks means the order has no limit price.
+    #  - Scenario 1 builds the book with four limit orders.
+    #  - Scenario 2's market buy should match the 8 shares at 101.0 first,
+    #    then 2 shares at 102.0.
+    #  - Scenario 3 cancels agent 2's buy order, which has ID 2.
+    #  - Scenario 4 buys at 111.0. The reference price is 100 and the F&O
+    #    band is 10%, so the upper band is 110 (11000 ticks).
+    actions = b"SSSSSCS"
+    scenario_ids = array('b', [1, 1, 1, 1, 2, 3, 4])
+    agent_ids = array('q', [1, 2, 3, 4, 5, 2, 6])
+    sides = array('b', [BUY, BUY, SELL, SELL, BUY, 0, BUY])
+    quantities = array('q', [10, 5, 8, 12, 10, 0, 10])
+    order_types = array('b', [LIMIT, LIMIT, LIMIT, LIMIT, MARKET, 0, LIMIT])
+    price_ticks = array('q', [9900, 9800, 10100, 10200, 0, 0, 11100])
+    target_ids = array('q', [0, 0, 0, 0, 0, 2, 0])
+
+    last = len(actions) - 1
+    for i in range(len(actions)):
+        scenario = scenario_ids[i]
+        title, log_outcomes, book_title = _SCENARIOS[scenario]
+        if i == 0 or scenario_ids[i - 1] != scenario:
+            log.info("\n--- %s ---", title)
+
+        if actions[i] == _SUBMIT:
+            accepted, reason, trades = submit(OrderRequest(agent_ids[i], sides[i], quantities[i],
+                                                           order_types[i], price_ticks[i] or None))
+            if log_outcomes:
+                log.info("Order Accepted: %s, Reason: %s", accepted, reason)
+                _log_trades(trades)
+        else:
+            cancelled = cancel(target_ids[i])
+            log.info("Order ID %d Cancelled Successfully: %s", target_ids[i], cancelled)
+
+        # Close the scenario after its last action
+        if i == last or scenario_ids[i + 1] != scenario:
+            if book_title is not None:
+                _log_order_book(exchange, book_title)
+                log.info("Best Bid: %s, Best Ask: %s", exchange.order_book.best_bid, exchange.order_book.best_ask)
+            log.info("-" * 35)
+
+def _percentile(sorted_values: list, q: float) -> int:
+    """Returns the q-th quantile (0 <= q <= 1) of an already sorted list."""
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+def drive(n: int = 1_000_000, seed: int = 0):
+    """
+    Throughput harness: pushes `n` synthetic events through a fresh exchange
+    and logs throughput and per-event latency percentiles.
+
+    The flow is 65% cancels, 25% limit orders and 10% market orders. Limit
+    prices are spread around the reference price, and cancels target one of
+    the most recently submitted orders, which may already have traded.
+    """
+    rng = random.Random(seed)
+    exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+    # Typed int facade: no result tuples or trade views are built per call
+    submit_limit = exchange.submit_limit
+    submit_market = exchange.submit_market
+    cancel = exchange.cancel_order
+    mid_tick = 10000
+
+    # Pre-generate the whole event stream so only the exchange calls are timed
+    kinds = array('b')
+    sides = array('b')
+    quantities = array('q')
+    price_ticks = array('q')
+    cancel_lags = array('q')
+    for _ in range(n):
+        r = rng.random()
+        kinds.append(_CANCEL if r < 0.65 else _LIMIT_ORDER if r < 0.90 else _MARKET_ORDER)
+        sides.append(BUY if rng.random() < 0.5 else SELL)
+        quantities.append(rng.randint(1, 100))
+        price_ticks.append(mid_tick + rng.randint(-50, 50))
+        cancel_lags.append(rng.randint(0, 199))
+
+    latencies = ([], [], [])
+    last_order_id = 0
+    clock = time.perf_counter_ns
+    start = clock()
+    for i in range(n):
+        kind = kinds[i]
+        t0 = clock()
+        if kind == _CANCEL:
+            cancel(last_order_id - cancel_lags[i])
+        else:
+            if kind == _LIMIT_ORDER:
+                order_id = submit_limit(sides[i], quantities[i], price_ticks[i])
+            else:
+                order_id = submit_market(sides[i], quantities[i])
+            if order_id: # 0 means rejected, which leaves the newest order unchanged
+                last_order_id = order_id
+        latencies[kind].append(clock() - t0)
+    elapsed = clock() - start
+
+    log.info("--- Synthetic order flow: %d events, seed %d ---", n, seed)
+    log.info("Elapsed: %.3f s, throughput: %.0f events/s", elapsed / 1e9, n / (elapsed / 1e9))
+    log.info("%-8s %10s %10s %10s %10s", "event", "count", "p50 ns", "p99 ns", "p99.9 ns")
+    for kind, samples in enumerate(latencies + ([x for samples in latencies for x in samples],)):
+        if not samples:
+            continue
+        samples.sort()
+        name = _EVENT_NAMES[kind] if kind < len(_EVENT_NAMES) else "all"
+        log.info("%-8s %10d %10d %10d %10d", name, len(samples), _percentile(samples, 0.50),
+                 _percentile(samples, 0.99), _percentile(samples, 0.999))
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("--verbose", action="store_true", help="also print the order book after each scenario")
+    verbosity.add_argument("--quiet", action="store_true", help="suppress all output")
+    parser.add_argument("--bench", action="store_true", help="run the synthetic order-flow harness instead of the scenarios")
+    parser.add_argument("-n", "--events", type=int, default=1_000_000, help="number of events for --bench")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for --bench")
+    args = parser.parse_args()
+
+    level = logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO
+    logging.basicConfig(level=level, format="%(message)s", stream=sys.stdout)
+    if args.bench:
+        drive(args.events, args.seed)
+    else:
+        main()
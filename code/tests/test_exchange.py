@@ -0,0 +1,155 @@
+"""
+Tests for order submission through the Exchange.
+
+Run from the code directory with: python -m unittest discover -s tests
+"""
+import time
+import unittest
+from datetime import time as time_of_day
+from indian_lob_exchange.exchange import Exchange
+from indian_lob_exchange.core.orders import OrderRequest, OrderSide, OrderType
+
+BUY, SELL = OrderSide.BUY, OrderSide.SELL
+LIMIT, MARKET = OrderType.LIMIT, OrderType.MARKET
+
+class OffTickPriceTest(unittest.TestCase):
+    """Limit prices that are not a whole number of ticks are rejected, not rounded."""
+
+    def setUp(self):
+        self.exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+
+    def test_off_tick_buy_does_not_trade_through_its_limit(self):
+        self.exchange.submit_order(1, SELL, 5, LIMIT, price=100.01)
+        accepted, reason, trades = self.exchange.submit_order(2, BUY, 5, LIMIT, price=100.006)
+        self.assertFalse(accepted)
+        self.assertIn("tick size", reason)
+        self.assertEqual(len(trades), 0)
+        self.assertEqual(self.exchange.order_book.best_ask, 100.01)
+
+    def test_off_tick_price_just_outside_the_band_is_rejected(self):
+        accepted, reason, _ = self.exchange.submit_order(1, BUY, 5, LIMIT, price=110.004)
+        self.assertFalse(accepted)
+        self.assertIsNone(self.exchange.order_book.best_bid)
+
+    def test_on_tick_prices_are_accepted(self):
+        for price in (90.0, 100.01, 110.0, 100 * 1.1):
+            accepted, reason, _ = self.exchange.submit_order(1, BUY, 1, LIMIT, price=price)
+            self.assertTrue(accepted, reason)
+
+class MissingLimitPriceTest(unittest.TestCase):
+    """LIMIT orders without a price are rejected before they touch the book."""
+
+    def test_limit_order_without_a_price_is_rejected(self):
+        exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        exchange.submit_order(1, SELL, 5, LIMIT, price_tick=10100)
+        trade_log = exchange.matching_engine.trade_log
+        # The fused path and the general path
+        for accepted, reason, trades in (exchange.submit_order(2, BUY, 8, LIMIT),
+                                         exchange._submit_order(2, BUY, 8, LIMIT, None, None, None)):
+            self.assertFalse(accepted)
+            self.assertIn("limit price", reason)
+            self.assertEqual(len(trades), 0)
+        self.assertEqual(exchange.submit_limit(BUY.value, 8, None), 0)
+
+        self.assertEqual(trade_log.write_index, 0)
+        self.assertEqual(exchange.order_book.asks.best_level.total_volume, 5)
+
+class OrderRequestTest(unittest.TestCase):
+    """submit_request accepts the same side and order type forms as submit_order."""
+
+    def test_enum_members_and_ints_are_equivalent(self):
+        for side, order_type in ((BUY, LIMIT), (BUY.value, LIMIT.value)):
+            exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+            exchange.submit_order(1, SELL, 5, LIMIT, price_tick=10000)
+            accepted, reason, trades = exchange.submit_request(OrderRequest(2, side, 3, order_type, 10000))
+            self.assertTrue(accepted, reason)
+            self.assertEqual([(t.quantity, t.price_tick) for t in trades], [(3, 10000)])
+
+    def test_general_path_order_types(self):
+        exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        request = OrderRequest(1, BUY, 1, OrderType.STOP_LOSS, 9900, trigger_price=99.5)
+        accepted, reason, _ = exchange.submit_request(request)
+        self.assertTrue(accepted, reason)
+
+class BulkSubmitTest(unittest.TestCase):
+    """submit_orders_bulk behaves like the same orders passed to submit_order one by one."""
+
+    def test_bulk_matches_sequential_submits(self):
+        orders = [
+            (1, BUY, 10, LIMIT, 9900),
+            (2, BUY.value, 5, LIMIT.value, 9800),
+            (3, SELL, 8, LIMIT, 10100),
+            (4, SELL, 12, LIMIT, 12000), # Outside the price band
+            (5, SELL.value, 12, MARKET.value, None),
+        ]
+        bulk = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        sequential = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        bulk_results = bulk.submit_orders_bulk(orders, timestamp=0.0)
+        sequential_results = [sequential.submit_order(*order[:4], price_tick=order[4], timestamp=0.0)
+                              for order in orders]
+
+        def summarise(results):
+            return [(accepted, reason, [(t.maker_order_id, t.quantity, t.price_tick) for t in trades])
+                    for accepted, reason, trades in results]
+        self.assertEqual(summarise(bulk_results), summarise(sequential_results))
+        self.assertEqual([accepted for accepted, _, _ in bulk_results], [True, True, True, False, True])
+        self.assertEqual(str(bulk.order_book), str(sequential.order_book))
+
+class PriceBandTest(unittest.TestCase):
+    """The tick band admits the same on-tick prices as the float band."""
+
+    def test_band_edges_off_tick_are_rounded_inwards(self):
+        # A 10% band around 100.07 is 90.063 - 110.077
+        exchange = Exchange(reference_price=100.07, stock_category="fno_stocks")
+        for price, expected in ((110.07, True), (110.08, False), (90.07, True), (90.06, False)):
+            accepted, reason, _ = exchange.submit_order(1, BUY, 1, LIMIT, price=price)
+            self.assertEqual(accepted, expected, (price, reason))
+
+def local_timestamp(hour: int, minute: int, day: int = 2) -> float:
+    """Epoch seconds for a local time of day in March 2026."""
+    return time.mktime((2026, 3, day, hour, minute, 0, 0, 0, -1))
+
+class SessionTest(unittest.TestCase):
+    """The session rules follow order timestamps across session boundaries."""
+
+    def setUp(self):
+        self.exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        # Stand-in for the real session schedule, which is currently hardcoded to "regular"
+        self.sessions_looked_up = []
+        def get_current_session(current_time: time_of_day) -> str:
+            self.sessions_looked_up.append(current_time)
+            return "post_market" if current_time >= time_of_day(15, 40) else "regular"
+        self.exchange.compliance_engine.session_manager.get_current_session = get_current_session
+
+    def test_orders_are_rejected_after_the_post_market_boundary(self):
+        # MARKET orders take the fast path, STOP_LOSS orders the general path
+        for order_type, trigger_price in ((MARKET, None), (OrderType.STOP_LOSS, 99.0)):
+            with self.subTest(order_type=order_type):
+                for timestamp, expected in ((local_timestamp(10, 0), True),
+                                            (local_timestamp(15, 45), False),
+                                            # The next day's pre-market boundary brings back the regular rules
+                                            (local_timestamp(10, 0, day=3), True)):
+                    accepted, reason, _ = self.exchange.submit_order(
+                        1, BUY, 1, order_type, trigger_price=trigger_price, timestamp=timestamp)
+                    self.assertEqual(accepted, expected, reason)
+
+    def test_rules_follow_timestamps_that_go_backwards(self):
+        # A wall-clock order caches the session around the present day
+        self.exchange.submit_order(1, BUY, 1, LIMIT, price_tick=9900)
+        for timestamp, expected in ((local_timestamp(10, 0), True),
+                                    (local_timestamp(15, 45), False),
+                                    (local_timestamp(10, 0), True),
+                                    (local_timestamp(15, 45, day=1), False),
+                                    (local_timestamp(8, 0, day=2), True)):
+            accepted, reason, _ = self.exchange.submit_order(1, BUY, 1, MARKET, timestamp=timestamp)
+            self.assertEqual(accepted, expected, (time.ctime(timestamp), reason))
+
+    def test_rules_are_only_refreshed_at_boundaries(self):
+        for minute in range(0, 60, 5):
+            self.exchange.submit_order(1, BUY, 1, LIMIT, price_tick=9900, timestamp=local_timestamp(10, minute))
+        self.assertEqual(self.sessions_looked_up, [time_of_day(10, 0)])
+        self.exchange.submit_order(1, BUY, 1, LIMIT, price_tick=9900, timestamp=local_timestamp(15, 30))
+        self.assertEqual(self.sessions_looked_up, [time_of_day(10, 0), time_of_day(15, 30)])
+
+if __name__ == "__main__":
+    unittest.main()
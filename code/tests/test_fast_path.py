@@ -0,0 +1,100 @@
+"""
+Differential tests pinning the Exchange fast paths to the general path.
+
+submit_order_fast and the submit_limit/submit_market facade inline the
+compliance checks and call the matching loop directly; these tests replay
+the same random order flow through them and through _submit_order, which
+goes through SEBIComplianceEngine.validate_order and
+MatchingEngine.match_order, and require identical trades and book state.
+
+Run from the code directory with: python -m unittest discover -s tests
+"""
+import random
+import unittest
+from indian_lob_exchange.exchange import Exchange
+from indian_lob_exchange.core.orders import OrderSide, OrderType
+
+BUY, SELL = OrderSide.BUY.value, OrderSide.SELL.value
+LIMIT, MARKET = OrderType.LIMIT.value, OrderType.MARKET.value
+
+def random_flow(seed: int, n: int = 3000):
+    """Yields ("cancel", order_id) and ("submit", side, quantity, type, price_tick) events."""
+    rng = random.Random(seed)
+    for i in range(n):
+        r = rng.random()
+        if r < 0.3:
+            # About 70% of events are submissions, each consuming one order ID
+            newest = int(0.7 * i) + 1
+            yield ("cancel", rng.randint(max(1, newest - 50), newest))
+        else:
+            side = BUY if rng.random() < 0.5 else SELL
+            quantity = rng.randint(1, 20)
+            if r < 0.4:
+                yield ("submit", side, quantity, MARKET, None)
+            else:
+                # Mostly near the reference price, sometimes outside the 9000 - 11000 band
+                yield ("submit", side, quantity, LIMIT, rng.choice((rng.randint(9900, 10100),
+                                                                     rng.randint(8800, 11200))))
+
+def book_state(exchange: Exchange):
+    """The observable state of the book: every level's totals and live queue, and all live orders."""
+    book = exchange.order_book
+    sides = []
+    for ladder in (book.bids, book.asks):
+        sides.append([(limit.tick, limit.total_volume, limit.order_count,
+                       [order_id for order_id in limit.queue if order_id in book.live_orders])
+                      for limit in ladder])
+    orders = sorted((o.order_id, o.side_int, o.quantity, o.price_tick) for o in book.live_orders.values())
+    return sides, orders
+
+def trade_rows(trades):
+    return [(t.maker_order_id, t.taker_order_id, t.price_tick, t.quantity) for t in trades]
+
+class FastPathTest(unittest.TestCase):
+
+    def replay(self, seed: int, submit):
+        """Replays a flow, submitting through `submit`; returns per-event results and the exchange."""
+        exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        results = []
+        for step, event in enumerate(random_flow(seed)):
+            timestamp = float(step)
+            if event[0] == "cancel":
+                results.append(exchange.cancel_order(event[1]))
+            else:
+                _, side, quantity, order_type, price_tick = event
+                results.append(submit(exchange, side, quantity, order_type, price_tick, timestamp))
+        return results, exchange
+
+    @staticmethod
+    def general(exchange, side, quantity, order_type, price_tick, timestamp):
+        accepted, _, trades = exchange._submit_order(1, OrderSide(side), quantity, OrderType(order_type),
+                                                     price_tick, None, timestamp)
+        return accepted, trade_rows(trades)
+
+    @staticmethod
+    def fast(exchange, side, quantity, order_type, price_tick, timestamp):
+        accepted, _, trades = exchange.submit_order_fast(1, side, quantity, order_type, price_tick, timestamp)
+        return accepted, trade_rows(trades)
+
+    @staticmethod
+    def facade(exchange, side, quantity, order_type, price_tick, timestamp):
+        log = exchange.matching_engine.trade_log
+        start = log.write_index
+        if order_type == LIMIT:
+            order_id = exchange.submit_limit(side, quantity, price_tick, agent_id=1, timestamp=timestamp)
+        else:
+            order_id = exchange.submit_market(side, quantity, agent_id=1, timestamp=timestamp)
+        return order_id != 0, trade_rows(log.slice(start, log.write_index))
+
+    def test_fast_paths_match_the_general_path(self):
+        for seed in range(5):
+            expected, reference = self.replay(seed, self.general)
+            for submit in (self.fast, self.facade):
+                with self.subTest(seed=seed, path=submit.__name__):
+                    results, exchange = self.replay(seed, submit)
+                    self.assertEqual(results, expected)
+                    self.assertEqual(book_state(exchange), book_state(reference))
+                    self.assertEqual(exchange._order_id_counter, reference._order_id_counter)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Tests for market data subscriptions and batched delivery.
+
+Run from the code directory with: python -m unittest discover -s tests
+"""
+import unittest
+from indian_lob_exchange.agents.agent_interface import Agent
+from indian_lob_exchange.agents.market_data import MarketDataFeed
+
+class RecordingAgent(Agent):
+    """Records every batch and update it is sent."""
+
+    def __init__(self, agent_id: int):
+        super().__init__(agent_id, exchange=None)
+        self.batches = []
+        self.updates = []
+
+    def on_market_batch(self, updates: list):
+        self.batches.append(list(updates))
+        super().on_market_batch(updates)
+
+    def on_market_update(self, market_data):
+        self.updates.append(market_data)
+
+    def place_order(self):
+        pass
+
+class FlushTest(unittest.TestCase):
+
+    def setUp(self):
+        self.feed = MarketDataFeed()
+        self.agents = [RecordingAgent(i) for i in range(3)]
+        for agent in self.agents:
+            self.feed.subscribe(agent)
+
+    def test_one_batch_per_agent_per_flush(self):
+        events = [{"trade": i} for i in range(4)]
+        for event in events:
+            self.feed.broadcast(event)
+        self.feed.flush()
+        for agent in self.agents:
+            self.assertEqual(agent.batches, [events])
+            self.assertEqual(agent.updates, events)
+
+    def test_queue_is_empty_after_flush(self):
+        self.feed.broadcast({"trade": 1})
+        self.feed.flush()
+        self.assertEqual(self.feed._pending, [])
+        # Flushing an empty queue delivers nothing
+        self.feed.flush()
+        for agent in self.agents:
+            self.assertEqual(len(agent.batches), 1)
+
+class SubscriptionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.feed = MarketDataFeed()
+        self.agents = [RecordingAgent(i) for i in range(4)]
+        for agent in self.agents:
+            self.feed.subscribe(agent)
+
+    def assertIndexConsistent(self):
+        subscribers = self.feed._subscribers
+        self.assertEqual(len(self.feed._index), len(subscribers))
+        for position, agent in enumerate(subscribers):
+            self.assertEqual(self.feed._index[id(agent)], position)
+
+    def test_subscribing_twice_is_a_no_op(self):
+        self.feed.subscribe(self.agents[0])
+        self.assertEqual(len(self.feed._subscribers), 4)
+        self.assertIndexConsistent()
+        self.feed.broadcast({"trade": 1})
+        self.feed.flush()
+        self.assertEqual(len(self.agents[0].batches), 1)
+
+    def test_unsubscribe_from_the_middle(self):
+        self.feed.unsubscribe(self.agents[1])
+        self.assertNotIn(self.agents[1], self.feed._subscribers)
+        self.assertCountEqual(self.feed._subscribers,
+                              [self.agents[0], self.agents[2], self.agents[3]])
+        self.assertIndexConsistent()
+
+    def test_unsubscribe_from_the_end(self):
+        self.feed.unsubscribe(self.agents[3])
+        self.assertEqual(self.feed._subscribers, self.agents[:3])
+        self.assertIndexConsistent()
+
+    def test_unsubscribed_agent_gets_no_updates(self):
+        self.feed.unsubscribe(self.agents[1])
+        self.feed.unsubscribe(self.agents[3])
+        self.feed.broadcast({"trade": 1})
+        self.feed.flush()
+        self.assertEqual(self.agents[1].batches, [])
+        self.assertEqual(self.agents[3].batches, [])
+        self.assertEqual(len(self.agents[0].batches), 1)
+        self.assertEqual(len(self.agents[2].batches), 1)
+
+    def test_unsubscribe_unknown_agent_raises(self):
+        with self.assertRaises(ValueError):
+            self.feed.unsubscribe(RecordingAgent(99))
+        self.feed.unsubscribe(self.agents[0])
+        with self.assertRaises(ValueError):
+            self.feed.unsubscribe(self.agents[0])
+        self.assertIndexConsistent()
+
+if __name__ == "__main__":
+    unittest.main()
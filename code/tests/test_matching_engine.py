@@ -0,0 +1,50 @@
+"""
+Tests for the trade log and its views.
+
+Run from the code directory with: python -m unittest discover -s tests
+"""
+import unittest
+from indian_lob_exchange.core.matching_engine import TradeLog
+
+class TradeLogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.log = TradeLog(capacity=8)
+        for row in range(5):
+            self.log.record(100 + row, 200 + row, 10000 + row, row + 1, 0.0)
+        self.trades = self.log.slice(1, 4)
+
+    def test_indexing(self):
+        self.assertEqual(len(self.trades), 3)
+        self.assertEqual(self.trades[0].maker_order_id, 101)
+        self.assertEqual(self.trades[-1].price_tick, 10003)
+        with self.assertRaises(IndexError):
+            self.trades[3]
+        with self.assertRaises(TypeError):
+            self.trades["0"]
+
+    def test_last_price_tick(self):
+        self.assertEqual(self.log.last_price_tick, 10004)
+        self.log.record(0, 0, 9950, 1, 0.0)
+        self.assertEqual(self.log.last_price_tick, 9950)
+
+    def test_slicing_returns_a_list_of_views(self):
+        self.assertEqual([t.quantity for t in self.trades[1:]], [3, 4])
+        self.assertEqual([t.quantity for t in self.trades[::-1]], [4, 3, 2])
+        self.assertEqual(self.trades[5:], [])
+
+    def test_overwritten_rows_raise(self):
+        view = self.trades[0]
+        # Row 1 survives until 8 more trades have been recorded after it
+        for _ in range(4):
+            self.log.record(0, 0, 0, 0, 0.0)
+        self.assertEqual(view.maker_order_id, 101)
+        self.log.record(0, 0, 0, 0, 0.0)
+        with self.assertRaises(IndexError):
+            view.maker_order_id
+        with self.assertRaises(IndexError):
+            repr(self.trades[0])
+        self.assertEqual(self.trades[1].maker_order_id, 102)
+
+if __name__ == "__main__":
+    unittest.main()
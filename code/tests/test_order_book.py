@@ -0,0 +1,43 @@
+"""
+Tests for the order book's price levels.
+
+Run from the code directory with: python -m unittest discover -s tests
+"""
+import unittest
+from indian_lob_exchange.exchange import Exchange
+from indian_lob_exchange.core.orders import OrderSide, OrderType
+
+BUY, SELL = OrderSide.BUY, OrderSide.SELL
+LIMIT = OrderType.LIMIT
+
+class TombstoneTest(unittest.TestCase):
+    """Cancelled orders must not accumulate in a level's queue."""
+
+    def setUp(self):
+        self.exchange = Exchange(reference_price=100.0, stock_category="fno_stocks")
+        self.exchange.submit_order(1, BUY, 10, LIMIT, price_tick=9900, timestamp=0.0)
+        self.level = self.exchange.order_book.bids.best_level
+
+    def test_cancelling_the_newest_order_pops_it(self):
+        for _ in range(1000):
+            self.exchange.submit_order(2, BUY, 1, LIMIT, price_tick=9900, timestamp=0.0)
+            self.assertTrue(self.exchange.cancel_order(self.exchange._order_id_counter))
+        self.assertEqual(self.level.order_count, 1)
+        self.assertEqual(len(self.level.queue), 1)
+
+    def test_cancelling_from_the_middle_keeps_the_queue_bounded(self):
+        for _ in range(1000):
+            self.exchange.submit_order(2, BUY, 1, LIMIT, price_tick=9900, timestamp=0.0)
+            self.exchange.submit_order(3, BUY, 1, LIMIT, price_tick=9900, timestamp=0.0)
+            # Cancel the older of the two, leaving a tombstone behind the newer one
+            self.assertTrue(self.exchange.cancel_order(self.exchange._order_id_counter - 1))
+        self.assertEqual(self.level.order_count, 1001)
+        self.assertLessEqual(len(self.level.queue), 2 * self.level.order_count + 8)
+
+        # Time priority survives compaction: the first order still fills first
+        _, _, trades = self.exchange.submit_order(4, SELL, 12, LIMIT, price_tick=9900, timestamp=0.0)
+        self.assertEqual([trade.maker_order_id for trade in trades], [1, 3, 5])
+        self.assertEqual(self.level.total_volume, 10 + 1000 - 12)
+
+if __name__ == "__main__":
+    unittest.main()